@@ -107,34 +107,37 @@ class PolymorphicModelBase(ModelBase):
             # PolymorphicModel is guaranteed to be defined here
             from .models import PolymorphicModel
 
-            def replace_inheritance_descriptors(model):
-                for super_cls, field_to_super in model._meta.parents.items():
-                    if issubclass(super_cls, PolymorphicModel):
-                        if field_to_super is not None:
-                            setattr(
-                                new_class,
-                                field_to_super.name,
-                                NonPolymorphicForwardOneToOneDescriptor(field_to_super),
-                            )
-                            setattr(
-                                super_cls,
-                                field_to_super.remote_field.related_name
-                                or field_to_super.remote_field.name,
-                                NonPolymorphicReverseOneToOneDescriptor(
-                                    field_to_super.remote_field
-                                ),
-                            )
-                        else:  # pragma: no cover
-                            # proxy models have no field_to_super because the relations
-                            # are to the parent model - the else here should never
-                            # happen b/c we filter out proxy models above
-                            pass
-                        replace_inheritance_descriptors(super_cls)
-
-            replace_inheritance_descriptors(new_class)
+            cls._replace_inheritance_descriptors(new_class, new_class, PolymorphicModel)
         _clear_utility_caches()
         return new_class
 
+    @classmethod
+    def _replace_inheritance_descriptors(cls, new_class, model, polymorphic_base):
+        """
+        Install non-polymorphic parent link descriptors on ``new_class`` and the reverse
+        descriptors on each of its polymorphic ancestors, walking up from ``model``.
+        """
+        for super_cls, field_to_super in model._meta.parents.items():
+            if issubclass(super_cls, polymorphic_base):
+                if field_to_super is not None:
+                    setattr(
+                        new_class,
+                        field_to_super.name,
+                        NonPolymorphicForwardOneToOneDescriptor(field_to_super),
+                    )
+                    setattr(
+                        super_cls,
+                        field_to_super.remote_field.related_name
+                        or field_to_super.remote_field.name,
+                        NonPolymorphicReverseOneToOneDescriptor(field_to_super.remote_field),
+                    )
+                else:  # pragma: no cover
+                    # proxy models have no field_to_super because the relations
+                    # are to the parent model - the else here should never
+                    # happen b/c we filter out proxy models in __new__
+                    pass
+                cls._replace_inheritance_descriptors(new_class, super_cls, polymorphic_base)
+
     @property
     def base_objects(self):
         warnings.warn(
@@ -70,6 +70,12 @@ class PolymorphicGuard:
     def migration_key(self):
         return migration_fingerprint(self.action)
 
+    @cached_property
+    def _deconstructed(self):
+        # the autodetector may compare us to deconstructed tuples many times per
+        # field, so only deconstruct the wrapped action once
+        return self.action.deconstruct()
+
     def __eq__(self, other):
         if (
             isinstance(other, tuple)
@@ -80,7 +86,7 @@ class PolymorphicGuard:
             # deconstruct() tuple. This has been seen for SET(...) callables.
             # The arguments element may be a list instead of a tuple though, this
             # handles that special case
-            return self.action.deconstruct() == (
+            return self._deconstructed == (
                 other[0],
                 tuple(other[1]) if isinstance(other[1], list) else other[1],
                 other[2],
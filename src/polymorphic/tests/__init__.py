@@ -1 +1,5 @@
 HEADLESS = True
+
+# app label for models defined inside tests - it is not installed so these models never
+# reach migrations or content types
+THROWAWAY_APP_LABEL = "polymorphic_throwaway"
@@ -258,20 +258,15 @@ class TestPolymorphicSerializer:
         assert internal_value["resourcetype"] == "BlogBase"
 
     def test_get_serializer_from_model_or_instance_raises_keyerror(self):
-        from polymorphic.models import PolymorphicModel
-
-        # Create a model that is not in the mapping
-        class UnmappedModel(PolymorphicModel):
-            class Meta:
-                app_label = "drf"
-
+        # Project is a polymorphic model outside of the blog hierarchy, so neither it nor
+        # any of its ancestors are in the mapping
         serializer = BlogPolymorphicSerializer()
 
         with pytest.raises(KeyError) as excinfo:
-            serializer._get_serializer_from_model_or_instance(UnmappedModel)
+            serializer._get_serializer_from_model_or_instance(Project)
 
         assert "model_serializer_mapping" in str(excinfo.value)
-        assert "UnmappedModel" in str(excinfo.value)
+        assert "Project" in str(excinfo.value)
 
     def test_get_serializer_from_resource_type_keyerror_propagation(self):
         # This tests the case where _get_serializer_from_resource_type
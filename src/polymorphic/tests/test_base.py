@@ -2,21 +2,12 @@
 Tests for base.py metaclass edge cases to achieve high-value coverage.
 """
 
-import os
-import sys
 import warnings
-from unittest.mock import patch
 
-from django.db import models
-from django.test import TestCase
+from django.test import SimpleTestCase
 
-from polymorphic.base import ManagerInheritanceWarning, PolymorphicModelBase
-from polymorphic.managers import PolymorphicManager
-from polymorphic.models import PolymorphicModel
-from polymorphic.query import PolymorphicQuerySet
 
-
-class PrimaryKeyNameTest(TestCase):
+class PrimaryKeyNameTest(SimpleTestCase):
     def test_polymorphic_primary_key_name_correctness(self):
         """
         Verify that polymorphic_primary_key_name points to the root pk in the
@@ -34,19 +25,17 @@ class PrimaryKeyNameTest(TestCase):
 
         with warnings.catch_warnings(record=True) as w:
             warnings.simplefilter("always")
-            self.assertEqual(
-                CustomPkInherit.polymorphic_primary_key_name, CustomPkBase._meta.pk.attname
-            )
-            self.assertEqual(CustomPkInherit.polymorphic_primary_key_name, "id")
+            assert CustomPkInherit.polymorphic_primary_key_name == CustomPkBase._meta.pk.attname
+            assert CustomPkInherit.polymorphic_primary_key_name == "id"
 
-            self.assertEqual(Model2A.polymorphic_primary_key_name, Model2A._meta.pk.attname)
-            self.assertEqual(Model2A.polymorphic_primary_key_name, "id")
+            assert Model2A.polymorphic_primary_key_name == Model2A._meta.pk.attname
+            assert Model2A.polymorphic_primary_key_name == "id"
 
-            self.assertEqual(Model2B.polymorphic_primary_key_name, Model2A._meta.pk.attname)
-            self.assertEqual(Model2B.polymorphic_primary_key_name, "id")
+            assert Model2B.polymorphic_primary_key_name == Model2A._meta.pk.attname
+            assert Model2B.polymorphic_primary_key_name == "id"
 
-            self.assertEqual(Model2C.polymorphic_primary_key_name, Model2A._meta.pk.attname)
-            self.assertEqual(Model2C.polymorphic_primary_key_name, "id")
+            assert Model2C.polymorphic_primary_key_name == Model2A._meta.pk.attname
+            assert Model2C.polymorphic_primary_key_name == "id"
 
             assert w[0].category is DeprecationWarning
             assert "polymorphic_primary_key_name" in str(w[0].message)
@@ -59,9 +48,7 @@ class PrimaryKeyNameTest(TestCase):
 
         with warnings.catch_warnings(record=True) as w:
             warnings.simplefilter("always")
-            self.assertEqual(
-                Enhance_Inherit.polymorphic_primary_key_name, Enhance_Base._meta.pk.attname
-            )
-            self.assertEqual(Enhance_Inherit.polymorphic_primary_key_name, "base_id")
+            assert Enhance_Inherit.polymorphic_primary_key_name == Enhance_Base._meta.pk.attname
+            assert Enhance_Inherit.polymorphic_primary_key_name == "base_id"
             assert w[0].category is DeprecationWarning
             assert "polymorphic_primary_key_name" in str(w[0].message)
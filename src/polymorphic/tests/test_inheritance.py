@@ -1,10 +1,10 @@
 from polymorphic.tests.models import Foo, Bar, Baz
 from polymorphic.managers import PolymorphicManager
-from django.test import TestCase
+from django.test import SimpleTestCase
 
 
-class InheritanceTests(TestCase):
+class InheritanceTests(SimpleTestCase):
     def test_mixin_inherited_managers(self):
-        self.assertIsInstance(Foo._base_manager, PolymorphicManager)
-        self.assertIsInstance(Bar._base_manager, PolymorphicManager)
-        self.assertIsInstance(Baz._base_manager, PolymorphicManager)
+        assert isinstance(Foo._base_manager, PolymorphicManager)
+        assert isinstance(Bar._base_manager, PolymorphicManager)
+        assert isinstance(Baz._base_manager, PolymorphicManager)
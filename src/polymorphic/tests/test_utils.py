@@ -3,6 +3,7 @@ from django.test import TransactionTestCase
 from django.contrib.contenttypes.models import ContentType
 
 from polymorphic.models import PolymorphicModel, PolymorphicTypeUndefined
+from polymorphic.tests import THROWAWAY_APP_LABEL
 from polymorphic.tests.models import (
     Enhance_Base,
     Enhance_Inherit,
@@ -72,15 +73,19 @@ class UtilsTests(TransactionTestCase):
         Skipping abstract models that can't be used for querying.
         """
 
+        # these models are registered per process and never need tables, so this test
+        # is safe to run on parallel workers
         class A(PolymorphicModel):
             class Meta:
                 abstract = True
+                app_label = THROWAWAY_APP_LABEL
 
         class B(A):
             pass
 
         class C(B):
-            pass
+            class Meta:
+                app_label = THROWAWAY_APP_LABEL
 
         assert get_base_polymorphic_model(A) is None
         assert get_base_polymorphic_model(B) is B
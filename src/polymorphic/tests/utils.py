@@ -79,6 +79,10 @@ class GeneratedMigrationsPerClassMixin:
     """
     Generates migrations at class setup, applies them, and rolls them back at teardown.
 
+    The migration files are written to and removed from the app's migrations directory
+    in the source tree, so test classes using this mixin for the same app must not run
+    concurrently (e.g. under pytest-xdist or ``manage.py test --parallel``).
+
     Configure:
       - apps_to_migrate = ["my_app", ...]
       - database = "default" (optional)